@@ -0,0 +1,150 @@
+import time
+import asyncio
+import logging
+import aiohttp
+from transport import (HEADERS, CHALLENGE_STATUS, RETRY_STATUS, PortalResponse, retry_delay, retry_after_seconds,
+                       stage_timer)
+
+# Interstitial-only markers: normal pages also load /cdn-cgi/challenge-platform/ scripts
+CHALLENGE_MARKERS = ("<title>Just a moment...</title>", "cf-chl")
+# aiohttp can only decode br when the Brotli package is installed, which it isn't
+ASYNC_HEADERS = {**HEADERS, "Accept-Encoding": "gzip, deflate"}
+
+
+def is_challenge(text: str):
+    return any(marker in text for marker in CHALLENGE_MARKERS)
+
+
+class TokenBucket:
+    """Global requests-per-second limiter shared by every coroutine.
+
+    Additive increase, multiplicative decrease: every throttle signal scales the
+    rate by `decrease`, and while requests succeed it grows by `increase` req/s
+    per second, never by more than a tenth of the current rate in one step.
+    Growth follows the clock rather than the success count, so a low rate does
+    not jump back up after a single good response. Only requests sent after the
+    last decrease can lower the rate again, and traffic stops entirely only for
+    as long as the portal asks. The burst size follows the current rate.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 0.2, increase: float = 0.2, decrease: float = 0.7):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.increased_at = self.updated
+        self.decreased_at = float("-inf")
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def capacity(self):
+        return float(max(1, int(self.rate)))
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self, sent_at: float, pause: float = 0.0):
+        # Requests already in flight when the rate last dropped count as one signal, not many
+        if sent_at < self.decreased_at:
+            return
+        now = time.monotonic()
+        self.decreased_at = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, now + pause)
+        # A pause is not time the portal accepted traffic
+        self.increased_at = max(now, self.paused_until)
+        logging.warning(f"🐢 [RateLimit] Throttled, rate lowered to {self.rate:.2f} req/s.")
+
+    def reward(self):
+        now = time.monotonic()
+        if now <= self.increased_at:
+            return
+        step = min(self.increase * (now - self.increased_at), self.rate / 10)
+        self.increased_at = now
+        self.rate = min(self.max_rate, self.rate + step)
+
+
+class AsyncPortal:
+    """aiohttp client for the portal that borrows the warmed-up cookies of a PortalSession."""
+
+    def __init__(self, transport, rate: float, concurrency: int, max_retries: int = 5, metrics=None):
+        self.transport = transport
+        self.metrics = metrics
+        self.bucket = TokenBucket(rate)
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        self.session = aiohttp.ClientSession(headers=ASYNC_HEADERS, connector=connector)
+        self._load_cookies()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    def _load_cookies(self):
+        for cookie in self.transport.session.cookies:
+            self.session.cookie_jar.update_cookies({cookie.name: cookie.value})
+
+    async def _rewarm(self, seen_at):
+        await asyncio.to_thread(self.transport.ensure_warm, seen_at)
+        self._load_cookies()
+
+    async def post(self, path: str, data: dict, stage: str = None):
+        """POST with retries; the limiter wait is timed as `rate_wait`, each round trip under `stage`."""
+        for attempt in range(self.max_retries + 1):
+            with stage_timer(self.metrics, "rate_wait"):
+                sent_at = await self.bucket.acquire()
+            warmed_at = self.transport.warmed_at
+            try:
+                with stage_timer(self.metrics, stage):
+                    async with self.session.post(f"{self.transport.base_url}{path}", data=data) as resp:
+                        text = await resp.text()
+                        status, retry_after = resp.status, resp.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status, text, retry_after = None, "", None
+                logging.warning(f"[Async] {path} attempt {attempt + 1} failed: {e}")
+
+            challenged = status in CHALLENGE_STATUS and is_challenge(text)
+            if status is not None and status not in RETRY_STATUS and not challenged:
+                if status >= 400:
+                    # Same contract as PortalSession.post: an error page is never a result
+                    raise RuntimeError(f"{path} returned {status}")
+                self.bucket.reward()
+                return PortalResponse(status, text)
+            if attempt == self.max_retries:
+                break
+
+            delay = retry_delay(attempt, retry_after)
+            logging.warning(f"[Async] {path} returned {status}, backing off {delay:.1f}s.")
+            if self.metrics:
+                self.metrics.count("retries", "challenge" if challenged else str(status or "network"))
+            if challenged or status in CHALLENGE_STATUS:
+                await self._rewarm(warmed_at)
+            if challenged or status in (429,) + CHALLENGE_STATUS:
+                # Throttling signals slow every coroutine down, plain errors only this request.
+                # The lowered rate spaces requests out; everyone stops only for as long as the portal asks.
+                pause = delay if status in CHALLENGE_STATUS else retry_after_seconds(retry_after) or 0.0
+                self.bucket.penalize(sent_at, pause=pause)
+            else:
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(f"{path} still failing after {self.max_retries} retries (last status {status})")
@@ -0,0 +1,151 @@
+import time
+import random
+import threading
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Carries every fragment the cleaner rewrites, so the rewrite stage does real work
+INVOICE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>GST Invoice</title>
+<style>body {{ font-family: Arial, sans-serif; }} table {{ width: 100%; border-collapse: collapse; }}
+td, th {{ border: 1px solid #999; padding: 4px; }}</style></head>
+<body>
+<img src="/Content/img/indigo_web_logo.png" alt="IndiGo">
+<h2>Tax Invoice {invoice}</h2>
+<p>Customer: {email}</p>
+<table><tr><th>#</th><th>Description</th><th>Taxable value</th><th>IGST</th></tr>
+{rows}
+</table>
+<img src="/Content/img/Paramita_bagchsign.gif" alt="Signature">
+<div class="modal fade" id="sessionTimeout"><h4 class="modal-title">Session</h4>
+Your session is about to expire in <span>60</span>. Click OK to continue your session
+<button class="btntimer buttonGlbl" type="button" aria-hidden="true" data-dismiss="modal" onclick="javascript: window.location.href = domainurl">Cancel</button>
+<button class="btntimer buttonGlbl" type="button" aria-hidden="true" id="closeTimeOut">OK</button></div>
+<div class="modal fade" id="popup_login" tabindex="-1">{filler}</div>
+</body></html>
+"""
+ROW = "<tr><td>{i}</td><td>Air travel and related charges</td><td>{amount}.00</td><td>{tax}.00</td></tr>"
+
+LOOKUP_PAGE = """<!DOCTYPE html>
+<html><body><table>
+{links}
+</table></body></html>
+"""
+LINK = '<tr><td>{invoice}</td><td><a href="javascript:void(0)" id="PrintInvoice" invoice-number="{invoice}">Print</a></td></tr>'
+
+
+class MockPortal:
+    """Local stand-in for the GSTInvoiceDetails / GSTInvoice endpoints.
+
+    `latency` is the mean response delay in seconds (jittered +/-50%),
+    `error_rate` the share of requests answered with a 500, and `rate_limit`
+    the requests per second served before further requests get a 429.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.05, error_rate: float = 0.0,
+                 rate_limit: float = 0.0, invoices_per_lookup: int = 1, invoice_page: str = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.invoices_per_lookup = invoices_per_lookup
+        self.invoice_page = invoice_page
+        self.hits = {}
+        self._lock = threading.Lock()
+        self._window = (0, 0)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="mock-portal", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _count(self, status):
+        with self._lock:
+            self.hits[status] = self.hits.get(status, 0) + 1
+
+    def _throttled(self):
+        if not self.rate_limit:
+            return False
+        second = int(time.time())
+        with self._lock:
+            window, served = self._window
+            served = served + 1 if window == second else 1
+            self._window = (second, served)
+        return served > self.rate_limit
+
+    def _invoice_html(self, invoice, email):
+        if self.invoice_page:
+            with open(self.invoice_page, encoding="utf-8") as file:
+                return file.read()
+        rows = "\n".join(ROW.format(i=i, amount=1000 + i * 37, tax=50 + i) for i in range(1, 25))
+        return INVOICE_PAGE.format(invoice=invoice, email=email, rows=rows, filler="x" * 20000)
+
+    def _lookup_html(self, form):
+        key = form.get("indigoGSTDetails.PNR") or form.get("indigoGSTDetails.InvoiceNumber")
+        invoices = [key if i == 0 else f"{key}-{i}" for i in range(self.invoices_per_lookup)]
+        return LOOKUP_PAGE.format(links="\n".join(LINK.format(invoice=invoice) for invoice in invoices))
+
+    def _handler(self):
+        portal = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this keep-alive adds ~40 ms per request
+            disable_nagle_algorithm = True
+
+            def _send(self, status, body, headers=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                portal._count(status)
+
+            def do_GET(self):
+                self._send(200, "<html><body>GST invoice</body></html>")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+                if portal.latency:
+                    time.sleep(portal.latency * random.uniform(0.5, 1.5))
+                if portal._throttled():
+                    return self._send(429, "Too Many Requests", {"Retry-After": "1"})
+                if random.random() < portal.error_rate:
+                    return self._send(500, "Internal Server Error")
+                if self.path == "/Booking/GSTInvoiceDetails":
+                    return self._send(200, portal._lookup_html(form))
+                if self.path == "/Booking/GSTInvoice":
+                    invoice = form.get("IndigoGSTInvoice.InvoiceNumber", "")
+                    return self._send(200, portal._invoice_html(invoice, form.get("IndigoGSTInvoice.GSTEmail", "")))
+                self._send(404, "Not Found")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve a mock GoIndigo GST invoice portal.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--invoice-page", help="recorded GSTInvoice HTML to serve instead of the built-in page")
+    args = parser.parse_args()
+    portal = MockPortal(args.port, args.latency, args.error_rate, args.rate_limit, invoice_page=args.invoice_page)
+    print(f"Mock portal on {portal.url}")
+    portal.server.serve_forever()
@@ -0,0 +1,158 @@
+"""Offline throughput benchmark for IndigoBot against the local mock portal.
+
+    python -m bench.run_bench --items 300 --concurrency 1 4 16 --engines batch async
+
+Every case runs in a fresh process and working directory, so the state DB,
+cache and peak RSS of one case never leak into the next. The directories are
+deleted afterwards unless --keep is given.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+from bench.mock_portal import MockPortal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Smallest document most PDF readers accept; the stub renderer writes it for every invoice
+STUB_PDF = (b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+            b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+            b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]>>endobj\n"
+            b"trailer<</Root 1 0 R>>\n%%EOF\n")
+
+
+class StubRenderer:
+    """Writes a placeholder PDF after `delay` seconds instead of starting a real renderer."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.workers = os.cpu_count() or 1
+
+    def start(self):
+        return self
+
+    def close(self):
+        pass
+
+    def render(self, html_path, pdf_path):
+        if self.delay:
+            time.sleep(self.delay)
+        with open(pdf_path, "wb") as file:
+            file.write(STUB_PDF)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_case(case: dict):
+    workdir = tempfile.mkdtemp(prefix="indigo-bench-")
+    os.chdir(workdir)
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    # Imported here so indigo_bot.log lands in the case's own directory
+    sys.path.insert(0, ROOT)
+    import main
+
+    with open("bench.csv", "w", encoding="utf-8") as file:
+        file.write("INVOICE,PNR,EMAIL\n")
+        for i in range(case["items"]):
+            file.write(f"BENCH{i:06d},,customer{i % 10}@example.com\n")
+
+    argv = ["-y", "--input", "bench.csv", "--mode", "INVOICE",
+            "--batch-size", str(case["concurrency"]), "--interval", "0",
+            "--rps", str(case["rps"] if case["engine"] == "async" else 0),
+            "--portal-url", case["url"], "--warmup-url", f"{case['url']}/view-gst-invoice.html"]
+    if case["renderer"] != "stub":
+        argv += ["--renderer", case["renderer"]]
+    bot = main.IndigoBot(main.parse_args(argv))
+    if case["renderer"] == "stub":
+        bot._make_renderer = lambda: StubRenderer(case["stub_delay"])
+
+    start = time.perf_counter()
+    bot.execute()
+    elapsed = time.perf_counter() - start
+
+    summary = bot.metrics.summary()
+    rendered = summary["counters"].get("invoices", {}).get("rendered", 0)
+    return {
+        "engine": case["engine"],
+        "concurrency": case["concurrency"],
+        "items": case["items"],
+        "invoices": rendered,
+        "seconds": round(elapsed, 3),
+        "invoices_per_second": round(rendered / elapsed, 2) if elapsed else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "failures": sum(summary["counters"].get("failures", {}).values()),
+        "retries": sum(summary["counters"].get("retries", {}).values()),
+        "stages": summary["stages"],
+        "workdir": workdir,
+    }
+
+
+def print_table(results):
+    header = f"{'engine':<6} {'conc':>4} {'inv':>5} {'secs':>7} {'inv/s':>7} {'RSS MB':>7} {'fail':>4} {'retry':>5}  stage p50/p95 ms"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        stages = "  ".join(f"{name} {s['p50'] * 1000:.0f}/{s['p95'] * 1000:.0f}"
+                           for name, s in r["stages"].items() if name != "batch")
+        print(f"{r['engine']:<6} {r['concurrency']:>4} {r['invoices']:>5} {r['seconds']:>7.2f} "
+              f"{r['invoices_per_second']:>7.2f} {str(r['peak_rss_mb']):>7} {r['failures']:>4} {r['retries']:>5}  {stages}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark IndigoBot against a local mock portal.")
+    parser.add_argument("--items", type=int, default=200, help="CSV rows per case")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--engines", nargs="+", choices=["batch", "async"], default=["batch", "async"])
+    parser.add_argument("--rps", type=float, default=1000, help="token bucket rate for the async engine")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean mock response delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of mock responses that are 500")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="mock requests/second before 429s, 0 = off")
+    parser.add_argument("--invoices-per-lookup", type=int, default=1)
+    parser.add_argument("--invoice-page", help="recorded GSTInvoice HTML to serve")
+    parser.add_argument("--renderer", choices=["stub", "wkhtmltopdf", "chromium"], default="stub")
+    parser.add_argument("--stub-delay", type=float, default=0.0, help="seconds the stub renderer spends per PDF")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--keep", action="store_true", help="keep each case's working directory for inspection")
+    args = parser.parse_args(argv)
+
+    portal = MockPortal(latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit,
+                        invoices_per_lookup=args.invoices_per_lookup, invoice_page=args.invoice_page).start()
+    results = []
+    # spawn gives every case a clean interpreter, which keeps peak RSS per case honest
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        for engine in args.engines:
+            for concurrency in args.concurrency:
+                case = {"engine": engine, "concurrency": concurrency, "items": args.items, "rps": args.rps,
+                        "url": portal.url, "renderer": args.renderer, "stub_delay": args.stub_delay}
+                with ctx.Pool(1) as pool:
+                    result = pool.apply(run_case, (case,))
+                # Removed only once the case's process is gone and its log file is closed
+                if not args.keep:
+                    shutil.rmtree(result.pop("workdir"), ignore_errors=True)
+                results.append(result)
+                print(f"✅ {engine} x{concurrency}: {results[-1]['invoices_per_second']} invoices/s")
+    finally:
+        portal.stop()
+
+    print()
+    print_table(results)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"settings": vars(args), "mock_hits": portal.hits, "results": results}, file, indent=2)
+    print(f"\n📊 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
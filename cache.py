@@ -0,0 +1,104 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+
+class ContentCache:
+    """Gzip-compressed on-disk cache of portal responses under `temp/`.
+
+    Entries older than `ttl` seconds are ignored and removed; once the cache
+    grows past `max_bytes` the least recently used entries are evicted down to
+    `low_water` of it, so a full cache does not evict on every write.
+    File mtimes hold the write time, the order of the in-memory index the last use.
+    """
+
+    def __init__(self, root: str = os.path.join("temp", "cache"), max_bytes: int = 512 * 1024 * 1024,
+                 ttl: float = 7 * 24 * 3600, low_water: float = 0.9):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.low_water = low_water
+        self._lock = threading.Lock()
+        # path -> size, least recently used first
+        self._index = OrderedDict()
+        self._size = 0
+        entries = []
+        for kind in ("lookup", "html"):
+            os.makedirs(os.path.join(root, kind), exist_ok=True)
+            for name in os.listdir(os.path.join(root, kind)):
+                if not name.endswith(".gz"):
+                    continue
+                path = os.path.join(root, kind, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._index[path] = size
+            self._size += size
+
+    def _path(self, kind, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, kind, f"{digest}.gz")
+
+    def _get(self, kind, key):
+        path = self._path(kind, key)
+        with self._lock:
+            if path not in self._index:
+                return None
+            try:
+                if time.time() - os.path.getmtime(path) > self.ttl:
+                    self._remove(path)
+                    return None
+                with gzip.open(path, "rt", encoding="utf-8") as file:
+                    text = file.read()
+            except OSError:
+                self._remove(path)
+                return None
+            self._index.move_to_end(path)
+            return text
+
+    def _put(self, kind, key, text):
+        path = self._path(kind, key)
+        data = gzip.compress(text.encode("utf-8"))
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        with self._lock:
+            os.replace(tmp_path, path)
+            self._size += len(data) - self._index.pop(path, 0)
+            self._index[path] = len(data)
+            self._evict()
+
+    def _remove(self, path):
+        self._size -= self._index.pop(path, 0)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        if self._size <= self.max_bytes:
+            return
+        target = self.max_bytes * self.low_water
+        evicted = 0
+        while self._index and self._size > target:
+            self._remove(next(iter(self._index)))
+            evicted += 1
+        logging.info(f"🧹 [Cache] Evicted {evicted} entries, {self._size} bytes in use.")
+
+    def get_lookup(self, mode, key, email):
+        text = self._get("lookup", f"{mode}|{key}|{email}")
+        return json.loads(text) if text is not None else None
+
+    def put_lookup(self, mode, key, email, invoices):
+        self._put("lookup", f"{mode}|{key}|{email}", json.dumps(invoices))
+
+    def get_html(self, invoice_number):
+        return self._get("html", str(invoice_number))
+
+    def put_html(self, invoice_number, html):
+        self._put("html", str(invoice_number), html)
@@ -1,17 +1,26 @@
 import os
+import csv
 import sys
+import argparse
 import time
+import asyncio
+import re
+import hashlib
 import logging
-import requests
-import pdfkit
-import pandas as pd
+import threading
 from pathlib import Path
-from bs4 import BeautifulSoup
 from typing import Literal
 from itertools import islice
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from cloudscraper import create_scraper
-from replace_html_content import replace_content
+from pypdf import PdfWriter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from replace_html_content import replace_content, extract_invoice_numbers
+from transport import PortalSession, PortalResponse, PORTAL_URL, WARMUP_URL
+from pipeline import RenderPipeline
+from async_engine import AsyncPortal
+from state import RunState
+from cache import ContentCache
+from renderer import WkhtmltopdfRenderer, ChromiumRenderer
+from metrics import Metrics, ProgressReporter, serve_prometheus
 
 logging.basicConfig(
     filename='indigo_bot.log',
@@ -20,10 +29,57 @@ logging.basicConfig(
     filemode='a'
 )
 
-def chunks(data_dict, size):
-    it = iter(data_dict.items())
-    for _ in range(0, len(data_dict), size):
-        yield dict(islice(it, size))
+def chunks(items, size):
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+def stream_csv(paths, mode, log=True):
+    """Lazily yield (key, email) pairs from the CSV files, skipping blank and repeated rows"""
+    seen = set()
+    duplicates = 0
+    for path in paths:
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+            if mode not in (reader.fieldnames or []) or "EMAIL" not in reader.fieldnames:
+                raise ValueError(f"{path} needs {mode} and EMAIL columns, found {reader.fieldnames}")
+            for row in reader:
+                key, email = (row[mode] or "").strip(), (row["EMAIL"] or "").strip()
+                if not key or not email:
+                    continue
+                # 8-byte digests keep the seen-set small on very large inputs
+                digest = int.from_bytes(hashlib.blake2b(f"{key}|{email}".encode(), digest_size=8).digest(), "big")
+                if digest in seen:
+                    duplicates += 1
+                    continue
+                seen.add(digest)
+                yield key, email
+    if log:
+        logging.info(f"📥 Read {len(seen)} unique rows from {len(paths)} file(s), skipped {duplicates} duplicates.")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Download IndiGo GST invoices as PDFs. "
+                                                 "Any option left out is asked for interactively.")
+    parser.add_argument("--input", nargs="+", help="CSV file(s) with EMAIL and PNR/INVOICE columns")
+    parser.add_argument("--batch-size", type=int, help="PNR/Invoice Numbers to process at once")
+    parser.add_argument("--interval", type=int, help="seconds between batches")
+    parser.add_argument("--mode", choices=["PNR", "INVOICE"], help="search by PNR or by invoice number")
+    parser.add_argument("--rps", type=float, help="requests per second for the async engine, 0 = batches")
+    parser.add_argument("--retry-failed", action="store_true", default=None, help="only retry items that failed last run")
+    parser.add_argument("--renderer", choices=["wkhtmltopdf", "chromium"])
+    parser.add_argument("--merge", action="store_true", default=None, help="also write one merged PDF per email")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this port, 0 = off")
+    parser.add_argument("-y", "--non-interactive", action="store_true", help="use defaults instead of prompting")
+    parser.add_argument("--portal-url", default=PORTAL_URL, help=argparse.SUPPRESS)
+    parser.add_argument("--warmup-url", default=WARMUP_URL, help=argparse.SUPPRESS)
+    parser.add_argument("--state-db", default="indigo_state.db")
+    parser.add_argument("--cache-ttl", type=float, default=7 * 24 * 3600, help="seconds a cached response or finished lookup stays valid")
+    parser.add_argument("--cache-size", type=int, default=512, help="cache size limit in MB")
+    parser.add_argument("--summary", default="run_summary.json", help="where to write the end-of-run metrics")
+    args = parser.parse_args(argv)
+    if args.non_interactive and not args.mode:
+        parser.error("--mode is required with --non-interactive")
+    return args
 
 def get_base_path():
     """Get base path depending on execution context (PyInstaller or script)"""
@@ -32,93 +88,246 @@ def get_base_path():
     return os.path.abspath(os.path.dirname(__file__))
 
 class IndigoBot:
-    def __init__(self):
-        self.soup_maker = lambda text: BeautifulSoup(text, 'html.parser')
+    def __init__(self, args=None):
+        self.args = args or parse_args([])
 
-        wkhtmltopdf_path = os.path.join(get_base_path(), "wkhtmltox", "bin", "wkhtmltopdf.exe")
-        self.pdfkit_config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
-
-        if not os.path.isfile("indigo.csv"):
-            print("❌ indigo.csv not found in current directory.")
-            exit(1)
         try:
-            self.number_of_invoices_at_once = int(input("How many PNR/Invoice Numbers to process at once: "))
-            self.time_interval = int(input("Time Interval (in Seconds): "))
-            print("Enter Choice:\n1)Search By PNR\n2)Search By Invoice Number")
-            type_choice: Literal[1, 2] = int(input(">>"))
-            self.mode = "PNR" if type_choice == 1 else "INVOICE"
+            files = self._ask(self.args.input, "Input CSV file(s), comma separated (Enter for indigo.csv): ", [])
+            if isinstance(files, str):
+                files = [f.strip() for f in files.split(",") if f.strip()]
+            self.input_files = files or ["indigo.csv"]
+            self.number_of_invoices_at_once = int(self._ask(self.args.batch_size, "How many PNR/Invoice Numbers to process at once: ", 5))
+            self.time_interval = int(self._ask(self.args.interval, "Time Interval (in Seconds): ", 0))
+            if self.args.mode:
+                self.mode = self.args.mode
+            else:
+                print("Enter Choice:\n1)Search By PNR\n2)Search By Invoice Number")
+                type_choice: Literal[1, 2] = int(input(">>"))
+                self.mode = "PNR" if type_choice == 1 else "INVOICE"
+            self.requests_per_second = float(self._ask(self.args.rps, "Requests per second for async engine (0 = use batches): ", 0) or 0)
+            self.retry_failed_only = self._yes(self._ask(self.args.retry_failed, "Retry failed items from the last run only? (y/N): ", False))
+            renderer = self._ask(self.args.renderer, "PDF renderer (1 = wkhtmltopdf, 2 = headless Chromium): ", "wkhtmltopdf")
+            self.renderer_choice = "chromium" if renderer.strip() in ("2", "chromium") else "wkhtmltopdf"
+            self.merge_per_customer = self._yes(self._ask(self.args.merge, "Also write one merged PDF per email? (y/N): ", False))
+            self.metrics_port = int(self._ask(self.args.metrics_port, "Prometheus metrics port (Enter to skip): ", 0) or 0)
         except Exception as e:
             print("❌ Invalid input.")
             logging.exception("Input failure:", exc_info=e)
             sys.exit(1)
 
+        for path in self.input_files:
+            if not os.path.isfile(path):
+                print(f"❌ {path} not found.")
+                exit(1)
+
+    def _ask(self, value, prompt, default):
+        """CLI value if given, else the default when non-interactive, else the answer to `prompt`"""
+        if value is not None:
+            return value
+        if self.args.non_interactive:
+            return default
+        return input(prompt)
+
+    @staticmethod
+    def _yes(answer):
+        return answer if isinstance(answer, bool) else answer.strip().lower() == "y"
+
     def execute(self):
+        self.metrics = Metrics()
+        if self.metrics_port:
+            serve_prometheus(self.metrics, self.metrics_port)
         self._create_session()
+        self.state = RunState(self.args.state_db, lookup_ttl=self.args.cache_ttl)
+        self.cache = ContentCache(max_bytes=self.args.cache_size * 1024 * 1024, ttl=self.args.cache_ttl)
+        # PDFs of this run's invoices per email, for the optional merge at the end
+        self.run_pdfs = {}
+        self._run_pdfs_lock = threading.Lock()
+        # Invoices a row of this run has already taken; PNRs can share invoices
+        self._claimed = set()
+        self._claim_lock = threading.Lock()
         data = self.read_csv()
-        batched = list(chunks(data, self.number_of_invoices_at_once))
+        if self.retry_failed_only:
+            print("🔁 Retrying only the items that failed in the last run")
+            data = ((key, email) for key, email in data if self.state.has_failures(self.mode, key, email))
+        else:
+            # Counted alongside the run so a large input doesn't delay the first request
+            threading.Thread(target=self._count_items, name="count-rows", daemon=True).start()
 
-        print(f"\n🚀 Running {len(batched)} batches with up to {self.number_of_invoices_at_once} threads\n")
-        with ThreadPoolExecutor(max_workers=self.number_of_invoices_at_once) as executor:
-            futures = []
-            for i, batch in enumerate(batched, 1):
-                futures.append(executor.submit(self.process_batch, batch, self.mode, i))
+        self.renderer = self._make_renderer()
+        self.renderer.start()
+        try:
+            with ProgressReporter(self.metrics):
+                if self.requests_per_second > 0:
+                    self.execute_async(data)
+                else:
+                    self.execute_batches(data)
+        finally:
+            self.renderer.close()
+            self.metrics.write_summary(self.args.summary)
+        if self.merge_per_customer:
+            self.merge_pdfs_per_customer()
+
+    def _count_items(self):
+        # Same filtering as the real reader, so the ETA counts down to zero
+        try:
+            self.metrics.total_items = sum(1 for _ in stream_csv(self.input_files, self.mode, log=False))
+        except ValueError:
+            pass  # the real reader reports the bad file
+
+    def execute_batches(self, data):
+        print(f"\n🚀 Running batches of {self.number_of_invoices_at_once} with up to {self.number_of_invoices_at_once} threads\n")
+        with RenderPipeline(self.render_pdf, workers=self.renderer.workers) as self.pipeline, \
+                ThreadPoolExecutor(max_workers=self.number_of_invoices_at_once) as executor:
+            pending = {}
+            finished = 0
+            for i, batch in enumerate(chunks(data, self.number_of_invoices_at_once), 1):
+                pending[executor.submit(self.process_batch, batch, self.mode, i)] = i
+                # Keep only a couple of batches queued so the input is consumed as workers free up
+                while len(pending) > self.number_of_invoices_at_once * 2:
+                    finished += self._collect_batches(pending)
                 time.sleep(self.time_interval)
+            while pending:
+                finished += self._collect_batches(pending)
+        print(f"✅ Finished {finished} batches")
 
-            for i, future in enumerate(as_completed(futures), 1):
-                try:
-                    future.result()
-                    print(f"✅ Finished batch {i}/{len(futures)}")
-                except Exception as e:
-                    logging.exception(f"❌ Error in batch {i}: {e}")
-                    print(f"❌ Batch {i} failed: {e}")
+    @staticmethod
+    def _collect_batches(pending: dict):
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            i = pending.pop(future)
+            try:
+                future.result()
+                print(f"✅ Finished batch {i}")
+            except Exception as e:
+                logging.exception(f"❌ Error in batch {i}: {e}")
+                print(f"❌ Batch {i} failed: {e}")
+        return len(done)
+
+    def execute_async(self, data):
+        print(f"\n🚀 Running async at {self.requests_per_second} req/s, "
+              f"up to {self.number_of_invoices_at_once} in flight\n")
+        with RenderPipeline(self.render_pdf, workers=self.renderer.workers) as self.pipeline:
+            asyncio.run(self._run_async(data))
+
+    async def _run_async(self, data):
+        items = iter(data)
+        loop = asyncio.get_running_loop()
+        async with AsyncPortal(self.transport, self.requests_per_second, self.number_of_invoices_at_once,
+                               metrics=self.metrics) as portal:
+            def post(path, data, stage=None):
+                # Called from an item thread: the request itself runs on the event loop
+                return asyncio.run_coroutine_threadsafe(portal.post(path, data, stage=stage), loop).result()
 
-    def process_batch(self, batch: dict, mode: str, batch_index: int):
+            # Item threads of their own, so AsyncPortal's to_thread re-warms can't queue behind them
+            with ThreadPoolExecutor(max_workers=self.number_of_invoices_at_once,
+                                    thread_name_prefix="async-item") as executor:
+                # A fixed set of workers pulling from one iterator caps the requests in flight
+                workers = [self._async_worker(executor, post, items) for _ in range(self.number_of_invoices_at_once)]
+                await asyncio.gather(*workers)
+
+    async def _async_worker(self, executor, post, items):
+        # sqlite, gzip, hashing and file writes all block, so the shared per-item flow runs off the event loop
+        loop = asyncio.get_running_loop()
+        for key, email in items:
+            await loop.run_in_executor(executor, self.process_item, post, self.mode, key, email, "Async")
+
+    def process_batch(self, batch: list, mode: str, batch_index: int):
         start = time.time()
         logging.info(f"🚀 Batch #{batch_index} started with {len(batch)} items.")
 
-        for key, email in batch.items():
-            try:
-                if mode == "PNR":
-                    invoices = self.fetch_all_invoice_number_for_a_datum(email, pnr=key)
-                else:
-                    invoices = self.fetch_all_invoice_number_for_a_datum(email, invoice_number=key)
-
-                for invoice in invoices:
-                    try:
-                        self.make_data_fetch_request(email, invoice)
-                        logging.info(f"[Batch {batch_index}] ✅ Processed invoice: {invoice}")
-                    except Exception as invoice_err:
-                        logging.exception(f"[Batch {batch_index}] ❌ Error with invoice {invoice}: {invoice_err}")
-            except Exception as e:
-                logging.exception(f"[Batch {batch_index}] ❌ Fetch error for {key}: {e}")
+        for key, email in batch:
+            self.process_item(self.transport.post, mode, key, email, f"Batch {batch_index}")
 
         duration = round(time.time() - start, 2)
+        self.metrics.observe("batch", duration)
         logging.info(f"✅ Batch #{batch_index} completed in {duration}s.")
 
-    def fetch_all_invoice_number_for_a_datum(self, email: str, invoice_number=None, pnr=None):
-        url = "https://book.goindigo.in/Booking/GSTInvoiceDetails"
-        headers = {
-            "Host": "book.goindigo.in",
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"macOS"',
-            "Accept-Language": "en-GB,en;q=0.9",
-            "Origin": "https://book.goindigo.in",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Upgrade-Insecure-Requests": "1",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Sec-Fetch-Dest": "document",
-            "Referer": "https://book.goindigo.in/",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Priority": "u=0, i",
-            "Connection": "keep-alive"
-        }
-        data = {
+    def process_item(self, post, mode, key, email, label):
+        """Look up one CSV row and queue its invoices for rendering; `post` is the engine's transport"""
+        try:
+            invoices = self.state.known_invoices(mode, key, email)
+            if invoices is None:
+                if mode == "PNR":
+                    invoices = self.fetch_all_invoice_number_for_a_datum(email, pnr=key, post=post)
+                else:
+                    invoices = self.fetch_all_invoice_number_for_a_datum(email, invoice_number=key, post=post)
+                self.state.record_lookup(mode, key, email, invoices)
+
+            for invoice in invoices:
+                if not self._claim(invoice):
+                    self.metrics.count("invoices", "shared")
+                    logging.info(f"[{label}] ⏭️ Already taken by another row: {invoice}")
+                    continue
+                if self._skip_if_rendered(invoice, email, label):
+                    continue
+                try:
+                    html_path = self.state.pending_html(invoice)
+                    if html_path is None:
+                        html_path = self.make_data_fetch_request(email, invoice, post=post)
+                        self.state.record_fetch(invoice, email, html_path)
+                    self.pipeline.submit(invoice, html_path, email)
+                    logging.info(f"[{label}] ✅ Fetched invoice: {invoice}")
+                except Exception as invoice_err:
+                    self.state.record_invoice_failure(invoice, email, "fetch", invoice_err)
+                    self.metrics.count("failures", f"fetch:{type(invoice_err).__name__}")
+                    logging.exception(f"[{label}] ❌ Error with invoice {invoice}: {invoice_err}")
+        except Exception as e:
+            self.state.record_lookup_failure(mode, key, email, e)
+            self.metrics.count("failures", f"lookup:{type(e).__name__}")
+            logging.exception(f"[{label}] ❌ Fetch error for {key}: {e}")
+        self.metrics.count("items", "done")
+
+    def _claim(self, invoice):
+        """True only for the first row of the run that reaches `invoice`, so it is fetched and rendered once"""
+        with self._claim_lock:
+            if invoice in self._claimed:
+                return False
+            self._claimed.add(invoice)
+            return True
+
+    def _skip_if_rendered(self, invoice, email, label):
+        if not self.state.is_rendered(invoice):
+            return False
+        self._remember_pdf(email, self.state.invoice(invoice)[3])
+        self.metrics.count("invoices", "skipped")
+        logging.info(f"[{label}] ⏭️ Already done: {invoice}")
+        return True
+
+    def fetch_all_invoice_number_for_a_datum(self, email: str, invoice_number=None, pnr=None, post=None):
+        post = post or self.transport.post
+        mode, key = ("PNR", pnr) if pnr else ("INVOICE", invoice_number)
+        invoices = self.cache.get_lookup(mode, key, email)
+        if invoices is not None:
+            self.metrics.count("cache_hits", "lookup")
+        else:
+            response = post("/Booking/GSTInvoiceDetails", self._lookup_payload(email, invoice_number, pnr), stage="lookup")
+            invoices = self._extract_invoice_numbers(response)
+            self._cache_lookup(mode, key, email, response, invoices)
+        return invoices
+
+    def make_data_fetch_request(self, email, invoice_number, post=None):
+        post = post or self.transport.post
+        html = self.cache.get_html(invoice_number)
+        if html is not None:
+            self.metrics.count("cache_hits", "html")
+            response = PortalResponse(200, html)
+        else:
+            response = post("/Booking/GSTInvoice", self._invoice_payload(email, invoice_number), stage="invoice")
+            self._cache_html(invoice_number, response)
+        return self.save_invoice_html(invoice_number, response)
+
+    def _cache_lookup(self, mode, key, email, response, invoices):
+        # Empty results are usually a typo'd email or a transient portal hiccup, so don't pin them
+        if response.status_code == 200 and invoices:
+            self.cache.put_lookup(mode, key, email, invoices)
+
+    def _cache_html(self, invoice_number, response):
+        if response.status_code == 200:
+            self.cache.put_html(invoice_number, response.text)
+
+    @staticmethod
+    def _lookup_payload(email: str, invoice_number=None, pnr=None):
+        return {
             "indigoGSTDetails.IsIndigoSkin": "true",
             "indigoGSTDetails.PNR": pnr if pnr else "",
             "indigoGSTDetails.CustEmail": email if pnr else "",
@@ -126,40 +335,10 @@ class IndigoBot:
             "indigoGSTDetails.InvoiceEmail": email if invoice_number else "",
             "GstRetrieve": "Retrieve"
         }
-        response = requests.post(url, headers=headers, data=data)
-        soup = self.soup_maker(response.text)
-        invoice_links = soup.find_all("a", {"id": "PrintInvoice"})
-        return [link.get("invoice-number") for link in invoice_links]
-
-    def make_data_fetch_request(self, email, invoice_number):
-        model_content1 = '<h4 class="modal-title">'
-        model_content2 = 'Click OK to continue your session'
-        model_content3 = '<button class="btntimer buttonGlbl"'
-        model_content4 = 'id="closeTimeOut">OK</button>'
-
-        url = "https://book.goindigo.in/Booking/GSTInvoice"
-        headers = {
-            "Host": "book.goindigo.in",
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"macOS"',
-            "Accept-Language": "en-GB,en;q=0.9",
-            "Origin": "https://book.goindigo.in",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Upgrade-Insecure-Requests": "1",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Sec-Fetch-Dest": "document",
-            "Referer": "https://book.goindigo.in/",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Priority": "u=0, i",
-            "Connection": "keep-alive"
-        }
-        data = {
+
+    @staticmethod
+    def _invoice_payload(email, invoice_number):
+        return {
             "__RequestVerificationToken": "dummy",
             "IndigoGSTInvoice.InvoiceNumber": str(invoice_number),
             "IndigoGSTInvoice.IsPrint": "false",
@@ -168,63 +347,77 @@ class IndigoBot:
             "IndigoGSTInvoice.ExemptedMsg": ""
         }
 
-        response = requests.post(url, headers=headers, data=data)
-        html_content = replace_content(response, model_content1, model_content2, model_content3, model_content4)
+    @staticmethod
+    def _extract_invoice_numbers(response):
+        return extract_invoice_numbers(response.text)
 
-        html_content = html_content.replace('Your session is about to expire in', '').replace('''type="button" aria-hidden="true" data-dismiss="modal" onclick="javascript: window.location.href = domainurl">Cancel''', '').replace('type="button" aria-hidden="true"', '')
-        index = html_content.find('<div class="modal fade" id="popup_login"')
-        final_content = html_content[:index] if index != -1 else html_content
+    def save_invoice_html(self, invoice_number, response):
+        with self.metrics.timer("rewrite"):
+            final_content = replace_content(response.text)
 
         os.makedirs("temp", exist_ok=True)
         html_path = os.path.join("temp", f"{invoice_number}.html")
         with open(html_path, "w", encoding="utf-8") as file:
             file.write(final_content)
+        return html_path
 
+    def render_pdf(self, invoice_number, html_path, email=None):
         os.makedirs("PDFs", exist_ok=True)
         pdf_path = os.path.join("PDFs", f"{invoice_number}.pdf")
-        pdfkit.from_file(html_path, pdf_path, configuration=self.pdfkit_config)
+        try:
+            with self.metrics.timer("render"):
+                self.renderer.render(html_path, pdf_path)
+        except Exception as e:
+            self.state.record_invoice_failure(invoice_number, email, "render", e)
+            self.metrics.count("failures", f"render:{type(e).__name__}")
+            raise
+        self.state.record_render(invoice_number, pdf_path)
+        self._remember_pdf(email, pdf_path)
+        self.metrics.count("invoices", "rendered")
         logging.info(f"✅ PDF created: {pdf_path}")
 
+    def _make_renderer(self):
+        if self.renderer_choice == "chromium":
+            return ChromiumRenderer()
+        return self._wkhtmltopdf()
+
+    @staticmethod
+    def _wkhtmltopdf():
+        return WkhtmltopdfRenderer(os.path.join(get_base_path(), "wkhtmltox", "bin", "wkhtmltopdf.exe"))
+
+    def _remember_pdf(self, email, pdf_path):
+        if email:
+            with self._run_pdfs_lock:
+                self.run_pdfs.setdefault(email, []).append(pdf_path)
+
+    def merge_pdfs_per_customer(self):
+        # Joins the PDFs this run already has on disk instead of rendering the invoices again
+        os.makedirs(os.path.join("PDFs", "merged"), exist_ok=True)
+        for email, pdf_paths in self.run_pdfs.items():
+            pdf_paths = sorted(set(pdf_paths))
+            safe_name = re.sub(r'[^\w.@-]', '_', email)
+            pdf_path = os.path.join("PDFs", "merged", f"{safe_name}.pdf")
+            try:
+                writer = PdfWriter()
+                for path in pdf_paths:
+                    writer.append(path)
+                with open(pdf_path, "wb") as file:
+                    writer.write(file)
+                logging.info(f"✅ Merged {len(pdf_paths)} invoices into {pdf_path}")
+            except Exception as e:
+                logging.exception(f"❌ Merging PDFs for {email} failed: {e}")
+
     def _create_session(self):
-        self.session = requests.Session()
-        self.session = create_scraper(self.session)
-        try:
-            headers = {
-            "Host": "book.goindigo.in",
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"macOS"',
-            "Accept-Language": "en-GB,en;q=0.9",
-            "Origin": "https://book.goindigo.in",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Upgrade-Insecure-Requests": "1",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Sec-Fetch-Dest": "document",
-            "Referer": "https://book.goindigo.in/",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Priority": "u=0, i",
-            "Connection": "keep-alive"
-        }
-            r = self.session.get("https://www.goindigo.in/view-gst-invoice.html", headers=headers)
-            logging.info(f"[Session] Indigo site status: {r.status_code}")
-        except Exception as e:
-            logging.exception("⛔ Session initialization failed.", exc_info=True)
+        self.transport = PortalSession(pool_size=self.number_of_invoices_at_once, metrics=self.metrics,
+                                       base_url=self.args.portal_url, warmup_url=self.args.warmup_url)
+        self.transport.warm_up()
 
     def read_csv(self):
-        df = pd.read_csv("indigo.csv")
-        if self.mode == "PNR":
-            return {row["PNR"]: row["EMAIL"] for _, row in df.iterrows()}
-        elif self.mode == "INVOICE":
-            return {row["INVOICE"]: row["EMAIL"] for _, row in df.iterrows()}
+        return stream_csv(self.input_files, self.mode)
 
 if __name__ == "__main__":
     try:
-        run = IndigoBot()
+        run = IndigoBot(parse_args())
         run.execute()
     except KeyboardInterrupt:
         print("🛑 Interrupted by user.")
@@ -0,0 +1,153 @@
+import sys
+import json
+import time
+import logging
+import threading
+from array import array
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Metrics:
+    """Per-stage latency samples and labelled counters for one run.
+
+    Stages are timed with `timer("lookup")`; counters are keyed by (name, cause),
+    e.g. `count("failures", "render:OSError")` or `count("retries", "429")`.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.total_items = None
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._counters = {}
+
+    @contextmanager
+    def timer(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(stage, array("d")).append(seconds)
+
+    def count(self, name: str, cause: str = "", value: int = 1):
+        with self._lock:
+            self._counters[(name, cause)] = self._counters.get((name, cause), 0) + value
+
+    def counter(self, name: str, cause: str = ""):
+        with self._lock:
+            return self._counters.get((name, cause), 0)
+
+    def stages(self):
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+        return {
+            stage: {
+                "count": len(values),
+                "total": round(sum(values), 4),
+                **{f"p{int(q * 100)}": round(percentile(values, q), 4) for q in QUANTILES},
+            }
+            for stage, values in samples.items()
+        }
+
+    def progress_line(self):
+        elapsed = time.time() - self.started_at
+        done = self.counter("items", "done")
+        rate = done / elapsed if elapsed else 0.0
+        line = f"⏱️ {done} items in {elapsed:.0f}s ({rate:.2f}/s), {self.counter('invoices', 'rendered')} PDFs"
+        if self.total_items and rate:
+            line += f", ETA {max(self.total_items - done, 0) / rate:.0f}s"
+        return line
+
+    def summary(self):
+        with self._lock:
+            counters = {}
+            for (name, cause), value in self._counters.items():
+                counters.setdefault(name, {})[cause or "total"] = value
+        elapsed = time.time() - self.started_at
+        return {
+            "started_at": self.started_at,
+            "elapsed_seconds": round(elapsed, 2),
+            "items_per_second": round(self.counter("items", "done") / elapsed, 4) if elapsed else 0.0,
+            "stages": self.stages(),
+            "counters": counters,
+        }
+
+    def write_summary(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+        logging.info(f"📊 Run summary written to {path}")
+
+    def prometheus_text(self):
+        lines = ["# TYPE indigo_stage_seconds summary"]
+        for stage, stats in self.stages().items():
+            for q in QUANTILES:
+                lines.append(f'indigo_stage_seconds{{stage="{stage}",quantile="{q}"}} {stats[f"p{int(q * 100)}"]}')
+            lines.append(f'indigo_stage_seconds_sum{{stage="{stage}"}} {stats["total"]}')
+            lines.append(f'indigo_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines.append("# TYPE indigo_events_total counter")
+        with self._lock:
+            counters = sorted(self._counters.items())
+        for (name, cause), value in counters:
+            lines.append(f'indigo_events_total{{name="{name}",cause="{cause}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class ProgressReporter:
+    """Rewrites one console line with throughput and ETA every `interval` seconds."""
+
+    def __init__(self, metrics: Metrics, interval: float = 5.0):
+        self.metrics = metrics
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        print(f"\r{self.metrics.progress_line()}   ")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            sys.stdout.write(f"\r{self.metrics.progress_line()}   ")
+            sys.stdout.flush()
+
+
+def serve_prometheus(metrics: Metrics, port: int, host: str = "127.0.0.1"):
+    """Expose `metrics` as Prometheus text on http://<host>:<port>/metrics from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logging.info(f"📊 Prometheus metrics on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,64 @@
+import os
+import queue
+import logging
+import threading
+
+_STOP = object()
+
+
+class RenderPipeline:
+    """Bounded hand-off between fetch threads and PDF render workers.
+
+    Fetch threads call `submit`, which blocks once `queue_size` items are
+    waiting, so the network stage can never run far ahead of the renderer.
+    Each render worker drives its own wkhtmltopdf subprocess, hence the pool
+    is sized to CPU cores rather than to the fetch concurrency.
+    """
+
+    def __init__(self, render, workers: int = None, queue_size: int = None):
+        self.render = render
+        self.workers = workers or os.cpu_count() or 1
+        self.queue = queue.Queue(maxsize=queue_size or self.workers * 2)
+        self.rendered = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"render-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+        logging.info(f"🖨️ Render pipeline started with {self.workers} workers, queue size {self.queue.maxsize}.")
+        return self
+
+    def submit(self, *item):
+        self.queue.put(item)
+
+    def close(self):
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        logging.info(f"🖨️ Render pipeline finished: {self.rendered} rendered, {self.failed} failed.")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _worker(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            try:
+                self.render(*item)
+                with self._lock:
+                    self.rendered += 1
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                logging.exception(f"❌ Render failed for {item[0]}: {e}")
@@ -0,0 +1,74 @@
+import os
+import asyncio
+import threading
+from pathlib import Path
+import pdfkit
+from playwright.async_api import async_playwright
+
+
+class WkhtmltopdfRenderer:
+    """One wkhtmltopdf process per invoice."""
+
+    def __init__(self, wkhtmltopdf_path: str):
+        self.configuration = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
+        # The cleaned HTML points at the shared images in assets/ via file:// URLs
+        self.options = {"enable-local-file-access": ""}
+        self.workers = os.cpu_count() or 1
+
+    def start(self):
+        return self
+
+    def close(self):
+        pass
+
+    def render(self, html_path, pdf_path):
+        pdfkit.from_file(html_path, pdf_path, configuration=self.configuration, options=self.options)
+
+
+class ChromiumRenderer:
+    """Long-lived headless Chromium that renders every invoice of the run.
+
+    The browser and `pages` tabs are opened once on a private event loop thread,
+    so startup and font loading are paid once and at most `pages` documents are
+    in memory at a time. `render` is safe to call from any render worker thread.
+    """
+
+    def __init__(self, pages: int = None):
+        self.workers = pages or os.cpu_count() or 1
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="chromium", daemon=True)
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def start(self):
+        self._thread.start()
+        self._call(self._launch())
+        return self
+
+    def close(self):
+        self._call(self._shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _launch(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self._pages = asyncio.Queue()
+        for _ in range(self.workers):
+            await self._pages.put(await self._browser.new_page())
+
+    async def _shutdown(self):
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def _render(self, html_path, pdf_path):
+        page = await self._pages.get()
+        try:
+            await page.goto(Path(html_path).resolve().as_uri(), wait_until="load")
+            await page.pdf(path=pdf_path, format="A4", print_background=True)
+        finally:
+            self._pages.put_nowait(page)
+
+    def render(self, html_path, pdf_path):
+        self._call(self._render(html_path, pdf_path))
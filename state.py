@@ -0,0 +1,124 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lookups (
+    mode TEXT NOT NULL,
+    key TEXT NOT NULL,
+    email TEXT NOT NULL,
+    invoices TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (mode, key, email)
+);
+CREATE TABLE IF NOT EXISTS invoices (
+    invoice_number TEXT PRIMARY KEY,
+    email TEXT,
+    html_path TEXT,
+    html_sha256 TEXT,
+    pdf_path TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def sha256_file(path):
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class RunState:
+    """SQLite completion index so a crashed run can pick up where it stopped.
+
+    Lookups are keyed by (mode, PNR/invoice, email); invoices by invoice number
+    and move through fetched -> rendered, or failed with the stage and error.
+    A lookup that found no invoices is kept as `empty`, so later runs ask again.
+    Finished lookups are reused for `lookup_ttl` seconds, like the response cache.
+    """
+
+    def __init__(self, path: str = "indigo_state.db", lookup_ttl: float = 7 * 24 * 3600):
+        self.path = path
+        self.lookup_ttl = lookup_ttl
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _write(self, sql, params):
+        with self._lock:
+            self.conn.execute(sql, params)
+
+    def _read(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def known_invoices(self, mode, key, email):
+        rows = self._read("SELECT invoices FROM lookups WHERE mode=? AND key=? AND email=? AND status='done' "
+                          "AND updated_at >= ?", (mode, str(key), email, time.time() - self.lookup_ttl))
+        return json.loads(rows[0][0]) if rows else None
+
+    def record_lookup(self, mode, key, email, invoices):
+        # The portal may not have published the invoice yet, so "none found" is never final
+        status = "done" if invoices else "empty"
+        self._write("INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, ?, ?, NULL, ?)",
+                    (mode, str(key), email, json.dumps(invoices), status, time.time()))
+
+    def record_lookup_failure(self, mode, key, email, error):
+        self._write("INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, NULL, 'failed', ?, ?)",
+                    (mode, str(key), email, str(error), time.time()))
+
+    def invoice(self, invoice_number):
+        rows = self._read("SELECT status, html_path, html_sha256, pdf_path FROM invoices WHERE invoice_number=?",
+                          (str(invoice_number),))
+        return rows[0] if rows else None
+
+    def record_fetch(self, invoice_number, email, html_path):
+        self._write("INSERT OR REPLACE INTO invoices VALUES (?, ?, ?, ?, NULL, 'fetched', NULL, ?)",
+                    (str(invoice_number), email, html_path, sha256_file(html_path), time.time()))
+
+    def record_render(self, invoice_number, pdf_path):
+        self._write("UPDATE invoices SET pdf_path=?, status='rendered', error=NULL, updated_at=? WHERE invoice_number=?",
+                    (pdf_path, time.time(), str(invoice_number)))
+
+    def record_invoice_failure(self, invoice_number, email, stage, error):
+        with self._lock:
+            self.conn.execute("INSERT OR IGNORE INTO invoices (invoice_number, email, status, updated_at) VALUES (?, ?, 'failed', ?)",
+                              (str(invoice_number), email, time.time()))
+            self.conn.execute("UPDATE invoices SET status='failed', error=?, updated_at=? WHERE invoice_number=?",
+                              (f"{stage}: {error}", time.time(), str(invoice_number)))
+
+    def pending_html(self, invoice_number):
+        """Path of an already fetched, unmodified HTML file that still needs rendering, if any."""
+        row = self.invoice(invoice_number)
+        if not row or row[0] not in ("fetched", "failed") or not row[1] or not os.path.isfile(row[1]):
+            return None
+        return row[1] if sha256_file(row[1]) == row[2] else None
+
+    def is_rendered(self, invoice_number):
+        row = self.invoice(invoice_number)
+        return bool(row and row[0] == "rendered" and row[3] and os.path.isfile(row[3]))
+
+    def has_failures(self, mode, key, email):
+        rows = self._read("SELECT status, invoices FROM lookups WHERE mode=? AND key=? AND email=?",
+                          (mode, str(key), email))
+        # Never looked up (the run stopped before reaching it) counts as unfinished too
+        if not rows:
+            return True
+        status, invoices = rows[0]
+        if status != "done":
+            return True
+        for invoice in json.loads(invoices):
+            row = self.invoice(invoice)
+            if row is None or row[0] != "rendered":
+                return True
+        return False
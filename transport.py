@@ -0,0 +1,133 @@
+import time
+import random
+import logging
+import threading
+from contextlib import nullcontext
+from collections import namedtuple
+from cloudscraper import create_scraper
+
+PORTAL_URL = "https://book.goindigo.in"
+WARMUP_URL = "https://www.goindigo.in/view-gst-invoice.html"
+
+HEADERS = {
+    "Cache-Control": "max-age=0",
+    "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"macOS"',
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Origin": PORTAL_URL,
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Upgrade-Insecure-Requests": "1",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-User": "?1",
+    "Sec-Fetch-Dest": "document",
+    "Referer": f"{PORTAL_URL}/",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Priority": "u=0, i",
+    "Connection": "keep-alive"
+}
+
+# Same shape as the bits of requests.Response the bot reads, for cached or async responses
+PortalResponse = namedtuple("PortalResponse", ["status_code", "text"])
+
+# Status codes Cloudflare answers with once the clearance cookies are gone
+CHALLENGE_STATUS = (403, 503)
+# Worth another attempt: throttling, transient server errors and challenges
+RETRY_STATUS = (429, 500, 502, 504) + CHALLENGE_STATUS
+
+
+def retry_after_seconds(retry_after):
+    return float(retry_after) if retry_after and retry_after.isdigit() else None
+
+
+def retry_delay(attempt: int, retry_after=None):
+    delay = retry_after_seconds(retry_after)
+    return (min(60, 2 ** attempt) if delay is None else delay) + random.uniform(0, 1)
+
+
+def stage_timer(metrics, stage):
+    return metrics.timer(stage) if metrics and stage else nullcontext()
+
+
+class PortalSession:
+    """One warmed-up cloudscraper session shared by every worker thread.
+
+    The https adapter keeps up to `pool_size` keep-alive connections, so each
+    thread of the executor reuses a socket instead of doing a new TLS handshake.
+    """
+
+    def __init__(self, pool_size: int, max_age: int = 900, metrics=None,
+                 base_url: str = PORTAL_URL, warmup_url: str = WARMUP_URL, timeout: float = 30):
+        self.base_url = base_url
+        self.warmup_url = warmup_url
+        self.max_age = max_age
+        self.timeout = timeout
+        self.metrics = metrics
+        self.warmed_at = 0.0
+        self.expires_at = float("inf")
+        self._lock = threading.Lock()
+
+        self.session = create_scraper()
+        self.session.headers.update(HEADERS)
+        # Re-size cloudscraper's own adapter so its cipher suite is kept
+        for prefix in ("https://", "http://"):
+            adapter = self.session.get_adapter(prefix)
+            adapter._pool_connections = 2
+            adapter._pool_maxsize = max(pool_size, 1)
+            adapter.init_poolmanager(adapter._pool_connections, adapter._pool_maxsize)
+
+    def warm_up(self):
+        with self._lock:
+            self._warm_up()
+
+    def _warm_up(self):
+        # Expired cookies would otherwise keep _is_stale() true and re-warm on every post
+        self.session.cookies.clear_expired_cookies()
+        try:
+            r = self.session.get(self.warmup_url, timeout=self.timeout)
+            logging.info(f"[Session] Indigo site status: {r.status_code}")
+        except Exception:
+            logging.exception("⛔ Session initialization failed.", exc_info=True)
+        self.warmed_at = time.time()
+        # Worked out once under the lock: iterating the jar on every post races with threads adding cookies
+        self.expires_at = min((cookie.expires for cookie in self.session.cookies if cookie.expires is not None),
+                              default=float("inf"))
+
+    def _is_stale(self):
+        now = time.time()
+        return now - self.warmed_at > self.max_age or now >= self.expires_at
+
+    def ensure_warm(self, seen_at):
+        # Only the first thread noticing stale cookies re-warms, the rest wait on the lock
+        with self._lock:
+            if self.warmed_at <= seen_at:
+                logging.info("🔄 [Session] Cookies expired, re-warming session.")
+                if self.metrics:
+                    self.metrics.count("rewarms")
+                self._warm_up()
+
+    def post(self, path: str, data: dict, max_retries: int = 3, stage: str = None):
+        """POST with retries; only the HTTP round trips are timed under `stage`, not the back-off sleeps."""
+        for attempt in range(max_retries + 1):
+            if self._is_stale():
+                self.ensure_warm(self.warmed_at)
+
+            warmed_at = self.warmed_at
+            with stage_timer(self.metrics, stage):
+                response = self.session.post(f"{self.base_url}{path}", data=data, timeout=self.timeout)
+            if response.status_code not in RETRY_STATUS or attempt == max_retries:
+                break
+
+            delay = retry_delay(attempt, response.headers.get("Retry-After"))
+            logging.warning(f"[Session] {path} returned {response.status_code}, retrying in {delay:.1f}s.")
+            if self.metrics:
+                self.metrics.count("retries", str(response.status_code))
+            if response.status_code in CHALLENGE_STATUS:
+                self.ensure_warm(warmed_at)
+            time.sleep(delay)
+        # An error page must never be parsed as "no invoices" or rendered as one
+        response.raise_for_status()
+        return response